@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImplementationRequest:
     """Validated implementation request."""
 
@@ -27,7 +27,7 @@ class ImplementationRequest:
         return self.request_path.with_name(f"{self.request_path.stem}.implementation-output.md")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewRequest:
     """Validated review request."""
 
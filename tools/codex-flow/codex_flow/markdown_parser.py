@@ -10,6 +10,7 @@ from .exceptions import ValidationError
 
 FIELD_PATTERN = re.compile(r"^\*\*(?P<name>[^*]+):\*\*\s*(?P<value>.*)$")
 HEADING_PATTERN = re.compile(r"^(?P<level>#+)\s+(?P<title>.+?)\s*$")
+_HEADING_NUMBER_PREFIX = re.compile(r"^\d+(?:\.\d+)*\.\s+")
 
 _ODV_FIELD_NAME = "On-Device Verification"
 _LEDGER_FIELD_NAME = "Observed-Failure Ledger"
@@ -335,7 +336,7 @@ def _require_absolute_path(value: str, field_name: str) -> Path:
 
 def _normalize_heading(title: str) -> str:
     normalized = title.strip()
-    return re.sub(r"^\d+(?:\.\d+)*\.\s+", "", normalized)
+    return _HEADING_NUMBER_PREFIX.sub("", normalized)
 
 
 def _extract_field_block(lines: list[str], name: str) -> str | None:
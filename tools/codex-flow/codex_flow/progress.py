@@ -18,7 +18,7 @@ ProgressMode = Literal["plain", "json", "quiet"]
 Workflow = Literal["implement", "review"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgressConfig:
     """Runtime configuration for progress output and persisted normalized logs."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import cache
 from importlib import resources
 from pathlib import Path
 
@@ -206,7 +207,10 @@ def write_schema_file(schema: dict, directory: Path, mode: str) -> Path:
     return path
 
 
+@cache
 def _resource_text(relative_path: str) -> str:
+    # Bundled resources cannot change while the process runs, and both prompt builders load
+    # the same skill files, so each one is read at most once.
     with resources.as_file(resources.files(RESOURCE_ROOT).joinpath(relative_path)) as path:
         return path.read_text(encoding="utf-8").strip()
 
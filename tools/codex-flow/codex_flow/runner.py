@@ -54,6 +54,7 @@ DISABLED_EXTERNAL_TOOL_FEATURES = (
 )
 UNKNOWN_CODEX_ACTIVITY_INTERVAL = 25
 MAX_CODEX_DIAGNOSTIC_LINES = 20
+_UNSAFE_TRACE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
 
 
 def run_implementation(request_path: Path, progress_config: ProgressConfig | None = None) -> Path:
@@ -123,7 +124,8 @@ def run_review(request_path: Path, progress_config: ProgressConfig | None = None
         final = _snapshot_repository(request.repository)
         changed_during_codex = _changed_paths(before, after_codex)
         changed = _changed_paths(before, final)
-        unexpected = sorted(path for path in changed if path != output_path.resolve())
+        resolved_output = output_path.resolve()
+        unexpected = sorted(path for path in changed if path != resolved_output)
         if unexpected:
             trace_path = _write_review_change_trace(
                 request.repository,
@@ -336,12 +338,13 @@ def _ensure_repository(path: Path) -> None:
 
 def _snapshot_repository(repository: Path) -> dict[Path, tuple[int, int]]:
     snapshot: dict[Path, tuple[int, int]] = {}
+    repository_root = repository.resolve()
     for path in repository.rglob("*"):
-        if not path.is_file():
-            continue
         if ".git" in path.parts:
             continue
-        if _is_ignored_review_artifact(path, repository):
+        if not path.is_file():
+            continue
+        if _is_ignored_review_artifact(path, repository_root):
             continue
         stat = path.stat()
         snapshot[path.resolve()] = (stat.st_size, stat.st_mtime_ns)
@@ -366,7 +369,7 @@ def _write_review_change_trace(
     state_home: Path,
 ) -> Path:
     timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
-    safe_stem = re.sub(r"[^A-Za-z0-9_.-]+", "-", output_path.stem).strip("-")
+    safe_stem = _UNSAFE_TRACE_NAME_CHARS.sub("-", output_path.stem).strip("-")
     trace_name = f"{safe_stem or 'review'}-{timestamp}.json"
     trace_dir = repository_state_dir(repository, state_home) / "review-traces"
     trace_dir.mkdir(parents=True, exist_ok=True)
@@ -406,13 +409,13 @@ def _display_repository_path(path: Path, repository: Path) -> str:
         return str(path)
 
 
-def _is_ignored_review_artifact(path: Path, repository: Path) -> bool:
+def _is_ignored_review_artifact(path: Path, repository_root: Path) -> bool:
     try:
-        relative_path = path.resolve().relative_to(repository.resolve())
+        relative_path = path.resolve().relative_to(repository_root)
     except ValueError:
         # Symlink target resolves outside the repository (e.g. .venv → /usr/bin/python)
         return True
-    if any(part in IGNORED_REVIEW_ARTIFACT_DIRS for part in relative_path.parts):
+    if not IGNORED_REVIEW_ARTIFACT_DIRS.isdisjoint(relative_path.parts):
         return True
     if path.name in IGNORED_REVIEW_ARTIFACT_NAMES:
         return True
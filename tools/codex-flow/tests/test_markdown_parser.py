@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -13,6 +14,9 @@ from codex_flow.markdown_parser import (
     parse_review_request,
 )
 
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = PACKAGE_ROOT.parents[1]
+
 # Sections codex-flow requires in every review request. Kept here so the template guard below
 # and the coverage guard that follows it stay tied to one list.
 REQUIRED_REQUEST_SECTIONS = (
@@ -613,51 +617,9 @@ pytest tests/test_sync.py
         parse_review_request(request)
 
 
-def test_parse_review_request_rejects_unfilled_ledger_placeholder(tmp_path: Path) -> None:
-    """The template placeholder must not satisfy the guard — it states nothing."""
-    request = tmp_path / "review.md"
-    request.write_text(
-        """
-# Review Request — Retry Handling
-
-**Repository:** `/tmp/repo`
-**Review Scope:** `HEAD~1..HEAD`
-**Output File:** `planning/reviews/retry.md`
-
-## Requirements
-
-- Retry transient failures up to three times
-
-## Constraints
-
-- Keep the CLI unchanged
-
-## Observed-Failure Ledger
-
-~~~markdown
-# (paste ledger here, or: No ledger exists for this work.)
-~~~
-
-## Evidence
-
-```bash
-pytest tests/test_sync.py
-```
-
-## Review Focus
-
-- correctness
-""".strip(),
-        encoding="utf-8",
-    )
-
-    with pytest.raises(ValidationError, match="No ledger exists for this work"):
-        parse_review_request(request)
-
-
 def test_shipped_example_review_request_still_parses() -> None:
     """The reference request must satisfy the parser it ships beside."""
-    example = Path(__file__).resolve().parents[1] / "examples" / "sample-review-request.md"
+    example = PACKAGE_ROOT / "examples" / "sample-review-request.md"
     assert example.is_file(), f"reference request missing: {example}"
 
     parsed = parse_review_request(example)
@@ -683,10 +645,9 @@ def test_request_templates_carry_every_required_section(producer: str) -> None:
     producer. This walks the actual templates, which live outside this package but inside the
     same repo, and skips when codex-flow is installed standalone.
     """
-    repo_root = Path(__file__).resolve().parents[3]
-    if not (repo_root / "platforms").is_dir():
+    if not (REPO_ROOT / "platforms").is_dir():
         pytest.skip("config repo not present — codex-flow installed standalone")
-    path = repo_root / producer
+    path = REPO_ROOT / producer
     assert path.is_file(), f"request producer missing: {producer}"
 
     text = path.read_text(encoding="utf-8")
@@ -760,6 +721,11 @@ pytest
 @pytest.mark.parametrize(
     "body",
     [
+        # The template placeholder states nothing, so it must not satisfy the guard either.
+        pytest.param(
+            "~~~markdown\n# (paste ledger here, or: No ledger exists for this work.)\n~~~",
+            id="unfilled-template-placeholder",
+        ),
         pytest.param("---", id="lone-separator"),
         pytest.param("<!-- TODO fill this in -->", id="html-comment"),
         pytest.param("<issue-folder>/observed-failures.md", id="unresolved-placeholder-path"),
@@ -908,7 +874,7 @@ pytest
     assert parsed.observed_failure_ledger is None
 
 
-def test_missing_request_error_names_the_directory_it_resolved_against(tmp_path: Path) -> None:
+def test_missing_request_error_names_the_directory_it_resolved_against() -> None:
     """A not-found error must say what the path was resolved against.
 
     Relative request paths are supported and normal. When one does not resolve, the missing
@@ -916,8 +882,6 @@ def test_missing_request_error_names_the_directory_it_resolved_against(tmp_path:
     not choose, and the path can look perfectly correct relative to the repo root. Naming the
     directory turns a two-step diagnosis into a one-step one.
     """
-    import os
-
     with pytest.raises(ValidationError, match=re.escape(os.getcwd())):
         parse_review_request(Path("planning/nope/review.md"))
 
@@ -18,6 +18,18 @@ from codex_flow.runner import (
     run_review,
 )
 
+# Serialized once: two review tests only need Codex to return a clean approval.
+_APPROVE_REVIEW_RESPONSE = json.dumps(
+    {
+        "final_status": "APPROVE",
+        "summary": "No correctness issues found.",
+        "findings": [],
+        "requirement_coverage": [],
+        "verification_gaps": [],
+        "recommendation": "Approve.",
+    }
+)
+
 
 class _FakeProcess:
     def __init__(self, stdout_text: str = "", return_code: int = 0) -> None:
@@ -251,19 +263,7 @@ def test_run_review_ignores_pytest_and_pyc_artifacts(
         (pycache_dir / "example.cpython-312.pyc").write_text("cache", encoding="utf-8")
         (pytest_cache_dir / "nodeids").write_text("[]", encoding="utf-8")
         output_index = command.index("--output-last-message") + 1
-        Path(command[output_index]).write_text(
-            json.dumps(
-                {
-                    "final_status": "APPROVE",
-                    "summary": "No correctness issues found.",
-                    "findings": [],
-                    "requirement_coverage": [],
-                    "verification_gaps": [],
-                    "recommendation": "Approve.",
-                }
-            ),
-            encoding="utf-8",
-        )
+        Path(command[output_index]).write_text(_APPROVE_REVIEW_RESPONSE, encoding="utf-8")
 
     _install_fake_popen(monkeypatch, on_start)
 
@@ -332,19 +332,7 @@ def test_run_review_emits_json_progress_and_external_log(
 
     def on_start(command: list[str]) -> None:
         output_index = command.index("--output-last-message") + 1
-        Path(command[output_index]).write_text(
-            json.dumps(
-                {
-                    "final_status": "APPROVE",
-                    "summary": "No correctness issues found.",
-                    "findings": [],
-                    "requirement_coverage": [],
-                    "verification_gaps": [],
-                    "recommendation": "Approve.",
-                }
-            ),
-            encoding="utf-8",
-        )
+        Path(command[output_index]).write_text(_APPROVE_REVIEW_RESPONSE, encoding="utf-8")
 
     _install_fake_popen(
         monkeypatch,